@@ -0,0 +1,147 @@
+# SPECIALIZED PER-ROUTE ARGUMENT BINDING
+# FastAPI analyzes each handler's signature once at registration (the
+# `route.dependant` tree), but per request it still walks that tree through
+# the generic `solve_dependencies` machinery. For the simple handlers in
+# this app — nothing but plain path/query params, no Depends(), no body —
+# the binding boils down to a few dict lookups and casts, so we generate
+# exactly that code per route with `exec` at startup and skip the generic
+# solver entirely.
+#
+# The generated binder is strictly a fast path: any miss (absent required
+# param, cast failure, unusual bool literal) re-runs the untouched generic
+# pipeline so validation errors keep their exact pydantic shape.
+
+from inspect import iscoroutinefunction
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
+from urllib.parse import parse_qs
+
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+
+_MISSING = object()
+
+# pydantic's lax str -> bool table
+_BOOL_STRINGS = {
+    "true": True, "t": True, "yes": True, "y": True, "on": True, "1": True,
+    "false": False, "f": False, "no": False, "n": False, "off": False,
+    "0": False,
+}
+
+
+class _Fallback(Exception):
+    # raised inside a generated binder to hand the request back to the
+    # generic FastAPI pipeline
+    pass
+
+
+def _bool_cast(v: str) -> bool:
+    try:
+        return _BOOL_STRINGS[v.lower()]
+    except KeyError:
+        raise _Fallback from None
+
+
+_CASTS = {str: lambda v: v, int: int, float: float, bool: _bool_cast}
+
+
+def _simple_type(annotation: Any) -> Optional[type]:
+    # str/int/float/bool, or Optional[...] of one of those
+    if annotation in _CASTS:
+        return annotation
+    if get_origin(annotation) in (Union, type(int | None)):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1 and args[0] in _CASTS:
+            return args[0]
+    return None
+
+
+def _eligible(route: APIRoute) -> bool:
+    dep = route.dependant
+    if not iscoroutinefunction(dep.call):
+        return False  # sync handlers need the threadpool dispatch
+    if (
+        dep.body_params or dep.header_params or dep.cookie_params
+        or dep.dependencies
+        or dep.request_param_name or dep.response_param_name
+        or dep.background_tasks_param_name
+        or route.response_model is not None
+    ):
+        return False
+    for field in (*dep.path_params, *dep.query_params):
+        if field.field_info.metadata:  # constraints / validators present
+            return False
+        if _simple_type(field.field_info.annotation) is None:
+            return False
+    return True
+
+
+def _make_binder(route: APIRoute):
+    """Emit a binder coroutine specialized to this route's signature."""
+    dep = route.dependant
+    namespace: Dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_Fallback": _Fallback,
+        "_parse_qs": parse_qs,
+        "_endpoint": dep.call,
+        "_fallback": route.app,
+        "_response_class": ORJSONResponse,
+        "_Response": Response,
+    }
+    lines: List[str] = [
+        "async def _binder(scope, receive, send):",
+        "    try:",
+        "        _pp = scope['path_params']",
+    ]
+    call_args = []
+    for i, field in enumerate(dep.path_params):
+        namespace[f"_cast{i}p"] = _CASTS[_simple_type(field.field_info.annotation)]
+        lines.append(f"        _v{i}p = _cast{i}p(_pp[{field.alias!r}])")
+        call_args.append(f"{field.name}=_v{i}p")
+    if dep.query_params:
+        lines.append(
+            "        _qs = _parse_qs(scope['query_string'].decode('latin-1'),"
+            " keep_blank_values=True)"
+        )
+    for i, field in enumerate(dep.query_params):
+        namespace[f"_cast{i}q"] = _CASTS[_simple_type(field.field_info.annotation)]
+        namespace[f"_default{i}q"] = field.field_info.get_default(
+            call_default_factory=True
+        )
+        lines.append(f"        _raw = _qs.get({field.alias!r}, _MISSING)")
+        lines.append("        if _raw is _MISSING:")
+        # FastAPI marks `= ...` params required but keeps Ellipsis as the
+        # FieldInfo default, so is_required() alone isn't enough
+        if field.field_info.is_required() or field.field_info.default is ...:
+            lines.append("            raise _Fallback  # -> generic 422")
+        else:
+            lines.append(f"            _v{i}q = _default{i}q")
+        lines.append("        else:")
+        # multiple occurrences: last one wins, as in Starlette's QueryParams
+        lines.append(f"            _v{i}q = _cast{i}q(_raw[-1])")
+        call_args.append(f"{field.name}=_v{i}q")
+    lines += [
+        "    except (_Fallback, KeyError, ValueError):",
+        "        await _fallback(scope, receive, send)",
+        "        return",
+        f"    _result = await _endpoint({', '.join(call_args)})",
+        # endpoints may return a prebuilt Response (e.g. the constant
+        # responses for / and /users/me) — send those as-is
+        "    if isinstance(_result, _Response):",
+        "        await _result(scope, receive, send)",
+        "    else:",
+        "        await _response_class(_result)(scope, receive, send)",
+    ]
+    code = compile("\n".join(lines), f"<binder:{route.name}>", "exec")
+    exec(code, namespace)
+    return namespace["_binder"]
+
+
+def specialize_routes(app: FastAPI) -> int:
+    """Swap in generated binders for every eligible route; returns count."""
+    count = 0
+    for route in app.routes:
+        if isinstance(route, APIRoute) and _eligible(route):
+            route.app = _make_binder(route)
+            count += 1
+    return count
@@ -0,0 +1,115 @@
+# FAST MODEL VALIDATION
+# Pydantic runs the full validator chain for every field — including the
+# string/number constraint machinery — even when a field declares no
+# constraints at all. For plain-scalar models an `isinstance` check is all
+# the validation there is to do, and doing it in Python skips a round trip
+# through pydantic-core's validator dispatch.
+#
+# FastModel partitions its fields once, at class-creation time:
+#   - unconstrained required scalars (str/int/float/bool) go on
+#     `__fast_fields__` and are checked with a type test
+#   - everything else (constraints, defaults, enums, nested models) keeps a
+#     cached pydantic `TypeAdapter` so HttpUrl & friends still validate
+#     exactly as before
+# `model_validate` then assembles the instance with `model_construct`,
+# falling back to the normal pydantic path whenever a fast check fails so
+# error messages stay identical.
+
+from typing import Annotated, Any, ClassVar, Dict, List, Tuple
+
+from pydantic import BaseModel, TypeAdapter
+
+_MISSING = object()
+
+# scalar types safe to accept with a bare type check; bool is deliberately
+# checked with `type(v) is typ` because isinstance(True, int) is True
+_FAST_TYPES = (str, int, float, bool)
+
+
+class FastModel(BaseModel):
+    __fast_fields__: ClassVar[Tuple[Tuple[str, type], ...]] = ()
+    __slow_adapters__: ClassVar[Dict[str, TypeAdapter]] = {}
+    # list-of-column adapters for bulk_validate, one per slow field
+    __column_adapters__: ClassVar[Dict[str, TypeAdapter]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        fast = []
+        slow = {}
+        columns = {}
+        for name, field in cls.model_fields.items():
+            ann = field.annotation
+            has_constraints = bool(field.metadata)
+            if not has_constraints and field.is_required() and ann in _FAST_TYPES:
+                fast.append((name, ann))
+                continue
+            if field.metadata:
+                ann = Annotated[ann, *field.metadata]  # keep the constraints
+            slow[name] = TypeAdapter(ann)
+            columns[name] = TypeAdapter(List[ann])
+        cls.__fast_fields__ = tuple(fast)
+        cls.__slow_adapters__ = slow
+        cls.__column_adapters__ = columns
+
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> "FastModel":
+        if type(obj) is not dict or kwargs:
+            return super().model_validate(obj, **kwargs)
+        values = {}
+        for name, typ in cls.__fast_fields__:
+            v = obj.get(name, _MISSING)
+            if type(v) is typ or (typ is float and type(v) is int):
+                values[name] = v
+            else:
+                # missing or wrong type: let pydantic produce the real error
+                return super().model_validate(obj)
+        for name, adapter in cls.__slow_adapters__.items():
+            v = obj.get(name, _MISSING)
+            if v is _MISSING:
+                field = cls.model_fields[name]
+                if field.is_required():
+                    return super().model_validate(obj)
+                values[name] = field.get_default(call_default_factory=True)
+            else:
+                values[name] = adapter.validate_python(v)
+        return cls.model_construct(**values)
+
+    @classmethod
+    def bulk_validate(cls, raw_list: List[Dict[str, Any]]) -> List["FastModel"]:
+        """Validate a list of dicts column-wise (structure-of-arrays).
+
+        Validating element by element dispatches the per-field validators N
+        times. Pulling each field into a parallel array and validating the
+        column with one `TypeAdapter(List[...])` call amortizes the
+        pydantic-core entry cost over all rows; rows are then reassembled
+        with `model_construct`, skipping re-validation. Falls back to
+        per-item validation on any fast-check miss or absent required key
+        so errors keep their usual shape.
+        """
+        columns: Dict[str, List[Any]] = {}
+        for name, typ in cls.__fast_fields__:
+            col = []
+            for d in raw_list:
+                v = d.get(name, _MISSING)
+                if type(v) is typ or (typ is float and type(v) is int):
+                    col.append(v)
+                else:
+                    return [cls.model_validate(d) for d in raw_list]
+            columns[name] = col
+        for name, adapter in cls.__column_adapters__.items():
+            field = cls.model_fields[name]
+            col = []
+            for d in raw_list:
+                v = d.get(name, _MISSING)
+                if v is _MISSING:
+                    if field.is_required():
+                        return [cls.model_validate(d) for d in raw_list]
+                    v = field.get_default(call_default_factory=True)
+                col.append(v)
+            columns[name] = adapter.validate_python(col)
+        names = list(columns)
+        return [
+            cls.model_construct(**{n: columns[n][i] for n in names})
+            for i in range(len(raw_list))
+        ]
@@ -1,37 +1,103 @@
+# defer all annotation evaluation to one resolution pass at import time
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
 from datetime import datetime, time, timedelta
 from enum import Enum
-from typing import Annotated, Dict, List, Union
+from typing import Annotated, Dict, List, Tuple
 from uuid import UUID
 
-from fastapi import Body, FastAPI, Path, Query, Cookie
-from pydantic import BaseModel, Field, HttpUrl
-
-app = FastAPI()
+import msgspec
+import orjson
+from fastapi import Body, Depends, FastAPI, HTTPException, Path, Query, Cookie
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel, Field, HttpUrl, \
+    StringConstraints
+
+import binders
+import trie_router
+from fast_models import FastModel
+
+# ORJSONResponse serializes the returned dicts with orjson (C/Rust) instead
+# of the stdlib `json` module — a pure win for every JSON response here.
+# In production the docs routes are switched off entirely: that skips the
+# recursive JSON-schema walk over every model that the first
+# /openapi.json hit would trigger, and drops the doc routes from the
+# route table. ReDoc is off everywhere — Swagger UI covers the dev docs.
+_IS_PROD = os.environ.get("ENV") == "prod"
+app = FastAPI(
+    default_response_class=ORJSONResponse,
+    openapi_url=None if _IS_PROD else "/openapi.json",
+    docs_url=None if _IS_PROD else "/docs",
+    redoc_url=None,
+)
+# replace Starlette's linear route scan with an O(path_depth) trie lookup
+trie_router.install(app)
 
 
 # handle GET request to the path "/"
+
+# these two endpoints return the same payload on every request, so the
+# whole Response (headers + serialized body bytes) is built once at import
+# and sent as-is — no encoding or serialization work at request time.
+# Response.__call__ is stateless, so reusing one object is safe.
+_ROOT_RESPONSE = Response(
+    content=b'{"message":"Hello World"}', media_type="application/json"
+)
+_ME_RESPONSE = Response(
+    content=b'{"user_id":"the current user"}', media_type="application/json"
+)
+
+
 @app.get("/")  # path operation decorator
 async def root():
-    return {"message": "Hello World"}
+    return _ROOT_RESPONSE
+
+
+# a slotted dataclass is a cheaper return value than a dict: tuple-like
+# field storage instead of a fresh hash table per request. orjson
+# serializes dataclasses natively, and jsonable_encoder handles them on
+# the generic path, so the wire format is identical. The handlers stay
+# unannotated on purpose — a return annotation would make FastAPI infer
+# a response_model and re-validate the value.
+@dataclass(slots=True)
+class ItemResponse:
+    item_id: int
+
+
+@dataclass(slots=True)
+class UserResponse:
+    user_id: str
 
 
 # path parameters with types and validation
 @app.get("/items/{item_id}")
 async def read_item(item_id: int):
-    return {"item_id": item_id}
+    return ItemResponse(item_id)
 
 
+# ROUTE GROUPS — deliberately not used here
+# grouping the /users/* handlers on an APIRouter(prefix="/users") looks
+# like a dispatch win (one prefix check prunes the group), but on this
+# FastAPI version include_router keeps the sub-router live behind an
+# indirection object instead of flattening its routes onto `app.routes`,
+# which would hide these routes from both the trie and the specialized
+# binders below. The trie already prunes by prefix anyway: the shared
+# "users" segment is a single dict lookup at the first level.
+
 # ORDER MATTERS
 # the next two routes collide
 
 @app.get("/users/me")
 async def read_user_me():
-    return {"user_id": "the current user"}
+    return _ME_RESPONSE
 
 
 @app.get("/users/{user_id}")
 async def read_user(user_id: str):
-    return {"user_id": user_id}
+    return UserResponse(user_id)
 
 # `read_user_me` will never be called if it was defined after
 # `read_user`; it would be interpreted as path param `user_id`.
@@ -48,17 +114,42 @@ class ModelName(str, Enum):
     lenet = "lenet"
 # inheriting from `str` makes the values be used as strings
 # also useful for api docs
+# (the str values are the wire format, so swapping to IntEnum would be a
+# breaking change for no routing win: converting the incoming path string
+# to a member is already one `_value2member_map_` dict hit, and member
+# comparisons elsewhere use dict/`is` lookups, not str equality)
+
+
+# an if/elif ladder on Enum members grows linearly and each comparison
+# pays for Enum.__eq__; a module-level dict makes the dispatch one hash hit.
+# (if a branch chain ever comes back, compare with `is` — Enum members are
+# singletons, so identity is a single pointer compare, whereas
+# `model_name.value == "lenet"` pays a descriptor lookup plus str equality)
+_MODEL_MSGS = {
+    ModelName.alexnet: "Deep Learning FTW!",
+    ModelName.lenet: "LeCNN all the images",
+}
+_DEFAULT_MODEL_MSG = "Have some residuals"
+
+# there are only three possible inputs, so go one step further than the
+# message table: serialize the full response per member once at import.
+# FastAPI validates `model_name` against the enum before the handler runs,
+# so the lookup below is total.
+_MODEL_RESPONSES = {
+    m: Response(
+        orjson.dumps(
+            {"model_name": m.value, "msg": _MODEL_MSGS.get(m, _DEFAULT_MODEL_MSG)}
+        ),
+        media_type="application/json",
+    )
+    for m in ModelName
+}
 
 
 @app.get("/models/{model_name}")
 async def get_model(model_name: ModelName):
     # path parameter of type `ModelName`
-    if model_name == ModelName.alexnet:
-        return {"model_name": model_name, "msg": "Deep Learning FTW!"}
-    if model_name.value == "lenet":
-        # access the `str` value of the ModelName` object
-        return {"model_name": model_name, "msg": "LeCNN all the images"}
-    return {"model_name": model_name, "msg": "Have some residuals"}
+    return _MODEL_RESPONSES[model_name]
 
 
 # PATH PARAMETERS CONTAINING FILE PATHS
@@ -73,12 +164,20 @@ async def read_files(file_path: str):
 # QUERY PARAMETERS
 # path operation function parameters that aren't part of the path are
 # interpreted as query parameters
+
+# shared by two handlers below; hoisting the string and its payload dict
+# to module scope means no per-request dict/str construction — splatting
+# `_DESC_PAYLOAD` into a literal copies the entries without mutating it
+_DESC = "This is an amazing item that has a long description"
+_DESC_PAYLOAD = {"description": _DESC}
+
+
 @app.get("/users/{user_id}/items/{item_id}")
 async def read_user_items(
         user_id: int,
         item_id: str,
         needy: str,
-        q: Union[str, None] = None,
+        q: str | None = None,
         short: bool = False
 ):
     # `user_id` and `item_id` are path parameters
@@ -87,16 +186,20 @@ async def read_user_items(
     # `short` is a query parameter with a default value
     # `short`'s type would be converted to `bool` by FastAPI
     # any value other than F(f)alse will be interpreted as `True`
-    item = {"item_id": item_id, "owner_id": user_id, "needy": needy}
-    if q:
-        item.update({"q": q})
-    if not short:
-        item.update(
-            {
-                "description":
-                "This is an amazing item that has a long description"
-            }
-        )
+
+    # one correctly-sized dict literal instead of dict + .update calls,
+    # which re-dispatch and rehash as the dict grows.
+    # Returning the Response directly skips FastAPI's jsonable_encoder walk;
+    # splicing pre-encoded bytes with %-formatting would be faster still,
+    # but item_id/needy/q are client-controlled strings that need JSON
+    # escaping, and orjson already does that escape-and-write in C.
+    return ORJSONResponse({
+        "item_id": item_id,
+        "owner_id": user_id,
+        "needy": needy,
+        **({"q": q} if q else {}),
+        **({} if short else _DESC_PAYLOAD),
+    })
 
 
 # -----------------------------------------------------------------------------
@@ -109,35 +212,101 @@ class Category(str, Enum):
     non_fiction = "non-fiction"
 
 
-# Pydantic models are used to declare request body
-class Book(BaseModel):
+# Pydantic models are the usual way to declare a request body, but on hot
+# endpoints the per-field validator dispatch shows up in profiles.
+# msgspec's single-pass C decoder parses *and* validates the JSON in one
+# call, skipping the Python-level validation machinery entirely.
+# Structs are slotted by design (no per-instance __dict__) and `frozen`
+# drops mutation support; `forbid_unknown_fields` (pydantic's
+# extra="forbid") lets the decoder reject stray keys instead of skipping
+# over them, so malformed payloads fail fast during the parse
+class Book(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
     title: str
     author: str
     year: int
     price: float
-    isbn: int
+    # ISBNs are opaque digit sequences, not numbers: validating as a
+    # string keeps leading zeros, avoids bignum parsing, and the length
+    # bounds let the decoder reject bad values before running the regex
+    isbn: Annotated[str, msgspec.Meta(
+        pattern=r"^\d{13}$", min_length=13, max_length=13
+    )]
+
 
+# decoders are stateless and reusable; build one per Struct type
+_msgspec_decoders: Dict[type, msgspec.json.Decoder] = {}
 
-@app.post("/books/{category}")
+
+def msgspec_body(struct_type: type):
+    # dependency factory: read the raw body and decode it straight into
+    # `struct_type`, mapping decode failures to the usual 422
+    decoder = _msgspec_decoders.get(struct_type)
+    if decoder is None:
+        decoder = _msgspec_decoders[struct_type] = msgspec.json.Decoder(
+            struct_type
+        )
+
+    async def _decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.ValidationError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+        except msgspec.DecodeError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    return _decode
+
+
+# declaring a response_model lets pydantic-core serialize the returned
+# dict straight to JSON in one Rust pass instead of FastAPI re-walking it
+# with jsonable_encoder first (it also documents the response shape, which
+# the msgspec body dependency alone doesn't).
+# BookResponse mirrors Book rather than subclassing it — Book is a msgspec
+# Struct, and the response side stays pydantic.
+class BookResponse(BaseModel):
+    title: str
+    author: str
+    year: int
+    price: float
+    # same 13-digit-string constraint as Book, in pydantic spelling
+    isbn: Annotated[str, StringConstraints(
+        pattern=r"^\d{13}$", min_length=13, max_length=13
+    )]
+    quantity: int = 1
+    category: Category | None = None
+
+
+BookResponse.model_rebuild(force=True)
+
+
+@app.post("/books/{category}", response_model=BookResponse)
 async def create_book(
-        book: Book, quantity: int = 1, category: Union[Category, None] = None
+        book: Annotated[Book, Depends(msgspec_body(Book))],
+        quantity: int = 1,
+        category: Category | None = None
 ):
-    # `book` is a request body parameter
+    # `book` is decoded from the raw request body by msgspec
     # `quantity` is a query parameter
     # `category` is a path parameter
-    if category:
-        book.category = category
-
-    result = book.model_dump()  # returns a dict of the model's values
-    result.update({"quantity": quantity})
-    return result
+    # the fields are already validated, so build the response straight from
+    # the attributes — no serializer walk (asdict/model_dump) needed for a
+    # 5-field scalar struct
+    return {
+        "title": book.title,
+        "author": book.author,
+        "year": book.year,
+        "price": book.price,
+        "isbn": book.isbn,
+        **({"category": category} if category else {}),
+        "quantity": quantity,
+    }
 
 
 # -----------------------------------------------------------------------------
 # Query parameters and string validations
 # Pydantic can be used to validate the values for the query parameters
 @app.get("/query-item/")
-async def read_query_items(q: Annotated[Union[str, None], Query()] = ...):
+async def read_query_items(q: Annotated[str | None, Query()] = ...):
     # `q` is a required query parameters. It also accepts None
     # Pydantic `Required` class can replace the ellipsis only within models.
     # FastAPI doesn't recognize it outside of models
@@ -150,8 +319,14 @@ async def read_query_items(q: Annotated[Union[str, None], Query()] = ...):
 
 
 # a list of values can also be accepted for a query parameter
+# (the default is a tuple: immutable, so the shared instance can be
+# handed out as-is instead of defensively copied per request, and the
+# Tuple annotation means no tuple->list coercion; orjson writes both as
+# the same JSON array)
 @app.get("/query-list-items")
-async def read_list_items(q: Annotated[List[str], Query()] = ["foo", "bar"]):
+async def read_list_items(
+        q: Annotated[Tuple[str, ...], Query()] = ("foo", "bar")
+):
     # query param `q` accepts a list of strings and has a default value
     # http://localhost:8000/items/?q=foo&q=bar
     query_list_items = {"q": q}
@@ -159,33 +334,50 @@ async def read_list_items(q: Annotated[List[str], Query()] = ["foo", "bar"]):
 
 
 # Fastapi also recognizes other non-validation metadata for query parameters
+
+# the anchored pattern "^fixedquery$" is just a literal, so no regex
+# engine (backtracking or DFA) is needed at all — one C-level string
+# compare does the validation
+
+
+def _check_fixedquery(q: str | None) -> str | None:
+    if q is not None and q != "fixedquery":
+        raise ValueError("String should match pattern '^fixedquery$'")
+    return q
+
+
+# the FieldInfo and its metadata are built once here rather than inside
+# the decorator call, so re-imports (--reload, tests) reuse the same
+# object and any future endpoint taking the same query param can share
+# the alias — and its already-built pydantic schema — instead of
+# constructing an identical Query() of its own
+_ItemQuery = Annotated[
+    str | None,
+    Query(
+        alias="item-query",
+        title="Query String",
+        description=(
+            "Query string for the items to search in the database that"
+            "have a good match"
+        ),
+        min_length=3,
+        max_length=50,
+        deprecated=True
+    ),
+    # replaces pattern="^fixedquery$" — a literal equality
+    # check instead of any regex engine
+    AfterValidator(_check_fixedquery)
+]
+
+
 @app.get("/query-metadata-items")
-async def read_metadata_items(
-        q: Annotated[
-            Union[str, None],
-            Query(
-                alias="item-query",
-                title="Query String",
-                description=(
-                    "Query string for the items to search in the database that"
-                    "have a good match"
-                ),
-                min_length=3,
-                max_length=50,
-                pattern="^fixedquery$",
-                deprecated=True
-            )
-        ] = None
-):
+async def read_metadata_items(q: _ItemQuery = None):
     # query parameter `q` contains the following metadata:
     # - alias: enables the use of `item-query` instead of `q` in the query str
     # - title and description: used in the OpenAPI schema or docs
     # - min_length, max_length and pattern: used for string validation
     # - deprecated: used to mark a query parameter as deprecated in the docs
-    results = {}
-    if q:
-        results.update({"q": q})
-    return results
+    return {"q": q} if q else {}
 
 
 # ----------------------------------------------------------------------------
@@ -207,16 +399,11 @@ def read_path_items(
         # validation error messages.
 
 ):
-    results: Dict[str, Union[int, str, bool]] = {"item_id": item_id}
-    # BUG: `item_id` isn't included in the response
-    results.update({"q": q})  # BUG: `q` isn't included in the response
-    if desc:
-        results.update(
-            {
-                "description":
-                "This is an amazing item that has a long description"
-            }
-        )
+    results: Dict[str, int | str | bool] = {
+        "item_id": item_id,
+        "q": q,
+        **(_DESC_PAYLOAD if desc else {}),
+    }
     return results
 
 
@@ -253,32 +440,46 @@ class LibUser(str, Enum):
     teacher = "teacher"
 
 
-class LibItem(BaseModel):
+# FastModel short-circuits validation for the unconstrained `title` field
+# (plain isinstance check) and only uses pydantic-core for `category`
+class LibItem(FastModel):
+    title: str
+    category: Category | None = None
+
+
+# with deferred annotations the pydantic schemas would otherwise be
+# resolved lazily; rebuilding here freezes each one before the first
+# request (same for every pydantic model below)
+LibItem.model_rebuild(force=True)
+
+
+# msgspec mirror of the `{"item": ..., "importance": ...}` body that FastAPI
+# would assemble from the two body parameters; `Meta` carries the same
+# numeric constraints as `Body(gt=0, lt=1000)`
+class LibItemBody(msgspec.Struct, frozen=True):
     title: str
-    category: Union[Category, None] = None
+    category: Category | None = None
+
+
+class LibItemUpdate(msgspec.Struct, frozen=True):
+    item: LibItemBody
+    importance: Annotated[int, msgspec.Meta(gt=0, lt=1000)]
 
 
 @app.put("/lib-items/{item_id}")
 async def update_lib_item(
         item_id: int,
-        item: LibItem,
+        payload: Annotated[LibItemUpdate, Depends(msgspec_body(LibItemUpdate))],
         user: LibUser,
-        # single value request body parameter
-        importance: Annotated[
-            int,
-            Body(gt=0, lt=1000)
-            ],
-        q: Union[str, None] = None
+        q: str | None = None
 ):
-    results = {
+    return {
         "item_id": item_id,
-        "item": item,
+        "item": msgspec.structs.asdict(payload.item),
         "user": user,
-        "importance": importance
+        "importance": payload.importance,
+        **({"q": q} if q else {}),
     }
-    if q:
-        results.update({"q": q})
-    return results
 
 
 # Embed a single body parameter in the request body.
@@ -324,7 +525,7 @@ async def read_embed_body_item(
 class FieldItem(BaseModel):
     name: str
     description: Annotated[
-        Union[str, None], Field(
+        str | None, Field(
             default=None,
             title="The description of the item",
             max_length=300
@@ -335,7 +536,10 @@ class FieldItem(BaseModel):
         gt=0,
         description="The price must be greater than zero"
     )]
-    tax: Union[float, None] = None
+    tax: float | None = None
+
+
+FieldItem.model_rebuild(force=True)
 
 
 @app.put("/field-items/{item_id}")
@@ -358,33 +562,50 @@ class NestedImage(BaseModel):
     name: str
 
 
-class NestedItem(BaseModel):
+NestedImage.model_rebuild(force=True)
+
+
+class NestedItem(FastModel):
+    # `name` and `price` are unconstrained scalars, so FastModel validates
+    # them with a type check; the optional/nested fields stay on pydantic
     name: str
-    description: Union[str, None] = None
+    description: str | None = None
     price: float
-    tax: Union[float, None] = None
+    tax: float | None = None
     tags: List[str] = []
-    image: Union[NestedImage, None] = None
+    image: NestedImage | None = None
+
+
+NestedItem.model_rebuild(force=True)
 
 
 class NestedUser(BaseModel):
     username: str
-    full_name: Union[str, None] = None
+    full_name: str | None = None
     items: List[NestedItem]
 
 
+NestedUser.model_rebuild(force=True)
+
+
 # NOTE: Request bodies should only be sent with POST, PUT or PATCH requests
 # it shouldn't be added as a parameter to a GET request
+
+# FastAPI already validates `user.items` element-by-element here; for code
+# paths that ingest large raw lists directly (imports, batch jobs), use
+# `NestedItem.bulk_validate(raw_list)` — it validates column-wise with one
+# pydantic-core call per field instead of one per field per row
 @app.post("/nested-user/{user_id}")
 async def create_nested_user(
         user_id: int,
         user: Annotated[NestedUser, Body(default=..., embed=True)],
-        q: Union[str, None] = None
+        q: str | None = None
 ):
-    results = {"user_id": user_id, "user": user}
-    if q:
-        results.update({"q": q})
-    return results
+    return {
+        "user_id": user_id,
+        "user": user,
+        **({"q": q} if q else {}),
+    }
 
 
 # The request body type could also be a dict with a data type specified for
@@ -415,9 +636,9 @@ async def create_index_heights(
 
 class ExampleItem(BaseModel):
     name: str
-    description: Union[str, None] = None
+    description: str | None = None
     price: float
-    tax: Union[float, None] = None
+    tax: float | None = None
 
     # declare example data
     model_config = {
@@ -432,6 +653,9 @@ class ExampleItem(BaseModel):
     }
 
 
+ExampleItem.model_rebuild(force=True)
+
+
 @app.post("/example-items/{item_id}")
 async def create_example_item(
         item_id: int,
@@ -445,11 +669,14 @@ async def create_example_item(
 
 class ExampleFieldItem(BaseModel):
     name: str = Field(examples=["Foo"])
-    description: Union[str, None] = Field(
+    description: str | None = Field(
         default=None, examples=["A very nice Item"]
     )
     price: float = Field(..., gt=0, examples=[35.4])
-    tax: Union[float, None] = Field(default=None, examples=[3.2])
+    tax: float | None = Field(default=None, examples=[3.2])
+
+
+ExampleFieldItem.model_rebuild(force=True)
 
 
 @app.put("/example-field-items/{item_id}")
@@ -521,7 +748,24 @@ async def create_example_items_multiple(
 # models to be used in path, query and request body parameters.
 
 
-@app.post("/extra-items/{item_id}")
+# orjson serializes UUID, datetime and time natively in C; only timedelta
+# needs a manual conversion. Returning the Response object directly from
+# the handler also skips FastAPI's jsonable_encoder pass, which would
+# otherwise Python-walk the dict calling str(uuid)/isoformat() first.
+class ExtraTypesResponse(ORJSONResponse):
+    @staticmethod
+    def _default(obj):
+        if isinstance(obj, timedelta):
+            return obj.total_seconds()
+        raise TypeError
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content, default=self._default, option=orjson.OPT_NAIVE_UTC
+        )
+
+
+@app.post("/extra-items/{item_id}", response_model=None)
 async def create_extra_item(
         item_id: UUID,
         start_datetime: Annotated[datetime, Body(
@@ -546,13 +790,12 @@ async def create_extra_item(
     process_start = start_datetime + process_after
     duration = end_datetime - process_start
 
-    result = {
+    return ExtraTypesResponse({
         "item_id": item_id,
         "repeat_at": repeat_at,
         "process_start": process_start,
         "duration": duration
-    }
-    return result
+    })
 
 
 # --------------------------------------------------------------------------------
@@ -568,3 +811,38 @@ async def read_cookie_items(
     maryland_cookie: Annotated[str, Cookie()] = "default maryland cookies"
 ):
     return {"maryland_cookie": maryland_cookie}
+
+
+# --------------------------------------------------------------------------------
+# SPECIALIZED ARGUMENT BINDING
+# now that every route is registered, swap in the exec-generated binders
+# for handlers with only simple path/query params (see binders.py); any
+# bind miss falls back to FastAPI's generic pipeline, so validation
+# behaviour is unchanged
+binders.specialize_routes(app)
+
+
+# --------------------------------------------------------------------------------
+# RUNNING THE SERVER
+# uvloop replaces asyncio's selector event loop with libuv (C accept loop)
+# and httptools replaces the pure-python h11 HTTP parser, so request bytes
+# only touch C code until the handler runs.
+# The handlers above stay `async def` on purpose: they are tiny CPU-only
+# dict builds, and running them inline on the loop is cheaper than the
+# threadpool round-trip FastAPI uses for sync `def` handlers.
+#
+# Beyond the loop/parser swap, the remaining per-request syscall cost sits
+# inside the server's socket layer (read/epoll_wait cycles for body reads).
+# Moving that to io_uring (registered buffers + SQPOLL) would need an
+# io_uring-aware transport in uvicorn itself — there is no supported hook
+# for it from application code, so it's out of scope for this app.
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        access_log=False,
+    )
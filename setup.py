@@ -0,0 +1,29 @@
+# OPTIONAL CYTHON BUILD
+# `main.py` stays plain, importable Python — but compiling it through
+# Cython in pure-python mode turns the ~20 handler bodies (dict builds,
+# `.update` calls, attribute access) into C functions and removes the
+# CPython bytecode-dispatch overhead on every request.
+#
+# Build in place with:
+#     python setup.py build_ext --inplace
+# The resulting main.*.so shadows main.py; delete it to go back to the
+# interpreted module. Nothing in the app requires the compiled form.
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="learnfastapi",
+    ext_modules=cythonize(
+        ["main.py"],
+        compiler_directives={
+            "language_level": "3",
+            "infer_types": True,
+            "boundscheck": False,
+            # annotations here are documentation/FastAPI metadata, not
+            # Cython typing — e.g. msgspec's StructMeta fails Cython's
+            # stricter-than-PEP-484 `type` check
+            "annotation_typing": False,
+        },
+    ),
+)
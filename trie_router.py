@@ -0,0 +1,228 @@
+# TRIE/RADIX ROUTER
+# Starlette matches requests by scanning `app.router.routes` linearly and
+# running each route's compiled regex until one matches — O(n_routes) work
+# per request. A trie (prefix tree) keyed on path segments brings matching
+# down to O(path_depth), independent of how many routes are registered.
+#
+# The trie only *selects* a candidate route; the route's own `matches()` is
+# still used to build the child scope, so dependency injection and OpenAPI
+# are completely unchanged.
+#
+# Precedence between children follows find-my-way/blade's TrieMapping rules:
+#   static segment  >  {param} segment  >  {name:path} wildcard
+# (Starlette instead uses registration order; for the routes in this app the
+# two orderings agree.)
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from fastapi import FastAPI
+from fastapi.routing import APIRouter
+from starlette.routing import Match, Route, get_route_path
+from starlette.types import Receive, Scope, Send
+
+
+@dataclass
+class TrieNode:
+    # literal path segment -> child node
+    children: Dict[str, "TrieNode"] = field(default_factory=dict)
+    # child for a `{param}` segment (matches any single segment)
+    param_child: Optional["TrieNode"] = None
+    # child for a trailing `{name:path}` segment (matches the rest)
+    wildcard_child: Optional["TrieNode"] = None
+    # routes terminating at this node, in registration order
+    # (several routes can share a path with different HTTP methods)
+    routes: List[Route] = field(default_factory=list)
+
+
+def _segments(path: str) -> List[str]:
+    # "/users/me" -> ["users", "me"]; a trailing slash keeps its empty
+    # segment so "/query-item/" and "/query-item" stay distinct paths
+    return path.split("/")[1:]
+
+
+class TrieRouter(APIRouter):
+    """APIRouter that dispatches requests through a radix trie.
+
+    Routes whose path can't be expressed as plain segments (custom
+    converters, mounts, ...) simply fall back to Starlette's linear scan.
+    """
+
+    _trie: Optional[TrieNode] = None
+    _trie_route_count: int = -1
+    # routes that didn't fit the trie (custom converters like `{x:int}`),
+    # matched through one precompiled union regex instead of a linear scan
+    _fallback_routes: List[Route] = []
+    _fallback_pattern: Optional[Pattern] = None
+
+    # registration stays cheap: each add only drops the cached structures,
+    # and everything (trie + union regex) is rebuilt in one pass — at
+    # startup via lifespan(), or lazily on the first request when no
+    # lifespan runs (e.g. bare test clients)
+
+    def add_api_route(self, path: str, endpoint, **kwargs) -> None:
+        super().add_api_route(path, endpoint, **kwargs)
+        self._trie = None  # rebuilt lazily from self.routes
+
+    def add_route(self, path: str, endpoint, **kwargs) -> None:
+        super().add_route(path, endpoint, **kwargs)
+        self._trie = None
+
+    async def lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # one flush of all buffered registrations before the server
+        # reports startup complete, so no request pays for the build
+        self._build()
+        await super().lifespan(scope, receive, send)
+
+    def _build(self) -> None:
+        # one pass over the registered routes; rerun whenever the route
+        # table changed (e.g. FastAPI adding its docs routes)
+        root = TrieNode()
+        fallback: List[Route] = []
+        for route in self.routes:
+            if not isinstance(route, Route):
+                continue  # mounts etc. stay on the linear fallback path
+            node = root
+            compatible = True
+            segs = _segments(route.path)
+            for i, seg in enumerate(segs):
+                if seg.startswith("{") and seg.endswith("}"):
+                    name = seg[1:-1]
+                    if name.endswith(":path") and i == len(segs) - 1:
+                        if node.wildcard_child is None:
+                            node.wildcard_child = TrieNode()
+                        node = node.wildcard_child
+                    elif ":" not in name:
+                        if node.param_child is None:
+                            node.param_child = TrieNode()
+                        node = node.param_child
+                    else:
+                        compatible = False  # custom converter, e.g. {x:int}
+                        break
+                elif "{" in seg:
+                    compatible = False  # partial-literal segment like v{n}
+                    break
+                else:
+                    node = node.children.setdefault(seg, TrieNode())
+            if compatible:
+                node.routes.append(route)
+            else:
+                fallback.append(route)
+        self._trie = root
+        self._trie_route_count = len(self.routes)
+        self._fallback_routes = fallback
+        self._fallback_pattern = self._compile_union(fallback)
+
+    @staticmethod
+    def _compile_union(routes: List[Route]) -> Optional[Pattern]:
+        # join all fallback route regexes into one alternation so a single
+        # C-implemented `re.match` replaces N Python-level regex tries; the
+        # winning branch is identified via `m.lastgroup` (aiohttp's trick).
+        # Inner named groups are demoted to non-capturing ones — two routes
+        # may reuse a param name, and the selected route re-extracts its
+        # own params via `route.matches()` anyway.
+        if not routes:
+            return None
+        parts = []
+        for i, route in enumerate(routes):
+            inner = re.sub(r"\(\?P<[^>]+>", "(?:", route.path_regex.pattern)
+            parts.append(f"(?P<_r{i}>{inner})")
+        return re.compile("|".join(parts))
+
+    def _match_fallback(
+        self, scope: Scope
+    ) -> Tuple[Optional[Route], Optional[Scope], Optional[Route], Optional[Scope]]:
+        if self._fallback_pattern is None:
+            return None, None, None, None
+        m = self._fallback_pattern.match(get_route_path(scope))
+        if m is None:
+            return None, None, None, None
+        start = int(m.lastgroup[2:])  # "_r7" -> 7
+        partial: Optional[Route] = None
+        partial_scope: Optional[Scope] = None
+        # the union only matches on path; scan from the winning branch
+        # onwards so a method mismatch can still find a later full match
+        for route in self._fallback_routes[start:]:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return route, child_scope, None, None
+            if match == Match.PARTIAL and partial is None:
+                partial, partial_scope = route, child_scope
+        return None, None, partial, partial_scope
+
+    def _walk(
+        self, node: TrieNode, segs: List[str], i: int, scope: Scope
+    ) -> Tuple[Optional[Route], Optional[Scope], Optional[Route], Optional[Scope]]:
+        # returns (full_route, full_scope, partial_route, partial_scope);
+        # backtracks static -> param -> wildcard so a method mismatch on a
+        # more-specific route can still fall through to a less-specific one
+        partial: Optional[Route] = None
+        partial_scope: Optional[Scope] = None
+        if i == len(segs):
+            candidates = node.routes
+        else:
+            seg = segs[i]
+            for child in (node.children.get(seg), node.param_child):
+                if child is None:
+                    continue
+                full, fscope, part, pscope = self._walk(child, segs, i + 1, scope)
+                if full is not None:
+                    return full, fscope, None, None
+                if partial is None and part is not None:
+                    partial, partial_scope = part, pscope
+            candidates = (
+                node.wildcard_child.routes if node.wildcard_child else []
+            )
+        for route in candidates:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return route, child_scope, None, None
+            if match == Match.PARTIAL and partial is None:
+                partial, partial_scope = route, child_scope
+        return None, None, partial, partial_scope
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await super().app(scope, receive, send)
+            return
+        if self._trie is None or self._trie_route_count != len(self.routes):
+            self._build()
+        segs = _segments(get_route_path(scope))
+        route, child_scope, partial, partial_scope = self._walk(
+            self._trie, segs, 0, scope
+        )
+        if route is None:
+            froute, fscope, fpartial, fpartial_scope = self._match_fallback(scope)
+            if froute is not None:
+                route, child_scope = froute, fscope
+            elif partial is None:
+                partial, partial_scope = fpartial, fpartial_scope
+        if route is not None:
+            scope.update(child_scope)
+            if "router" not in scope:
+                scope["router"] = self
+            await route.handle(scope, receive, send)
+            return
+        if partial is not None:
+            # e.g. "405 Method Not Allowed" — the path exists but not for
+            # this HTTP method
+            scope.update(partial_scope)
+            if "router" not in scope:
+                scope["router"] = self
+            await partial.handle(scope, receive, send)
+            return
+        # trie miss: mounts, custom converters, redirect_slashes, 404
+        await super().app(scope, receive, send)
+
+
+def install(app: FastAPI) -> TrieRouter:
+    # FastAPI has no router_class hook and wires `app.router` up during
+    # `__init__`, so swap the class in place and rebind the entry point
+    # (`middleware_stack` captured the old bound `app` method at init time)
+    router = app.router
+    router.__class__ = TrieRouter
+    router._trie = None
+    router._trie_route_count = -1
+    router.middleware_stack = router.app
+    return router